@@ -2,6 +2,7 @@
 from functools import partial
 
 from psygnal import Signal, SignalInstance
+from psygnal.containers import EventedList
 
 
 class CreateSuite:
@@ -102,3 +103,31 @@ class EmitSuite:
 
     def time_emit_to_all(self, n):
         self.emitter4.changed.emit(1)
+
+
+class EventedListSuite:
+    params = [[10, 100, 1000], [False, True]]
+    param_names = ["n", "connected"]
+
+    def setup(self, n, connected):
+        self.data = list(range(n))
+        self.my_list = EventedList(self.data)
+        if connected:
+            self.my_list.events.connect(callback)
+
+    def time_create(self, n, connected):
+        _ = EventedList(self.data)
+
+    def time_insert_delete(self, n, connected):
+        self.my_list.insert(0, 1)
+        del self.my_list[0]
+
+    def time_setitem(self, n, connected):
+        self.my_list[0] = self.my_list[0] + 1
+
+    def time_setitem_slice(self, n, connected):
+        self.my_list[::2] = self.data[::2]
+
+    def time_extend_delete_slice(self, n, connected):
+        self.my_list.extend(self.data)
+        del self.my_list[n:]
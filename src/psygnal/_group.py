@@ -10,7 +10,13 @@ the args that were emitted.
 from contextlib import contextmanager
 from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
 
-from psygnal._signal import NormedCallback, Signal, SignalInstance
+from psygnal._signal import (
+    NormedCallback,
+    Signal,
+    SignalInstance,
+    StoredSlot,
+    _build_signature,
+)
 
 __all__ = ["EmissionInfo", "SignalGroup"]
 
@@ -66,6 +72,8 @@ class _SignalGroupMeta(type):
         return cls
 
 
+_GROUP_SIGNATURE = _build_signature(EmissionInfo)
+
 InfoSlot = Callable[[EmissionInfo], None]
 OptionalInfoSlot = Union[InfoSlot, Callable[[], None]]
 
@@ -115,13 +123,11 @@ class SignalGroup(SignalInstance, metaclass=_SignalGroupMeta):
 
     def __init__(self, instance: Any = None, name: Optional[str] = None) -> None:
         super().__init__(
-            signature=(EmissionInfo,),
+            signature=_GROUP_SIGNATURE,
             instance=instance,
             name=name or self.__class__.__name__,
         )
         self._sig_was_blocked: Dict[str, bool] = {}
-        for _, sig in self.signals.items():
-            sig.connect(self._slot_relay, check_nargs=False, check_types=False)
 
     @property
     def signals(self) -> Dict[str, SignalInstance]:
@@ -133,6 +139,23 @@ class SignalGroup(SignalInstance, metaclass=_SignalGroupMeta):
         """Return true if all signals in the group have the same signature."""
         return cls._uniform
 
+    def _append_slot(self, slot: StoredSlot) -> None:
+        # The relay is only connected to the signals in this group while the group
+        # itself has slots. This way, a signal in the group is only truthy (i.e.
+        # `len(signal) > 0`) when emitting it would actually call something.
+        if not self._slots:
+            for sig in self.signals.values():
+                sig.connect(
+                    self._slot_relay, check_nargs=False, check_types=False, unique=True
+                )
+        super()._append_slot(slot)
+
+    def _remove_slot(self, idx: Optional[int]) -> None:
+        super()._remove_slot(idx)
+        if not self._slots:
+            for sig in self.signals.values():
+                sig.disconnect(self._slot_relay)
+
     def _slot_relay(self, *args: Any) -> None:
         emitter = Signal.current_emitter()
         if emitter:
@@ -198,8 +221,10 @@ class SignalGroup(SignalInstance, metaclass=_SignalGroupMeta):
     def block(self, exclude: Iterable[Union[str, SignalInstance]] = ()) -> None:
         """Block this signal and all emitters from emitting."""
         super().block()
+        # `exclude` may be a one-shot iterator, but is searched for every signal
+        exclude = tuple(exclude)
         for k, v in self.signals.items():
-            if exclude and v in exclude or k in exclude:
+            if exclude and (v in exclude or k in exclude):
                 continue
             self._sig_was_blocked[k] = v._is_blocked
             v.block()
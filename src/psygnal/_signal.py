@@ -208,16 +208,6 @@ class Signal:
         setattr(instance, name, signal_instance)
         return signal_instance
 
-    @classmethod
-    @contextmanager
-    def _emitting(cls, emitter: "SignalInstance") -> Iterator[None]:
-        """Context that sets the sender on a receiver object while emitting a signal."""
-        previous, cls._current_emitter = cls._current_emitter, emitter
-        try:
-            yield
-        finally:
-            cls._current_emitter = previous
-
     @classmethod
     def current_emitter(cls) -> Optional["SignalInstance"]:
         """Return currently emitting `SignalInstance`, if any.
@@ -305,6 +295,7 @@ class SignalInstance:
         "_instance",
         "_name",
         "_slots",
+        "_slots_snapshot",
         "_is_blocked",
         "_is_paused",
         "_args_queue",
@@ -339,6 +330,9 @@ class SignalInstance:
         self._check_nargs_on_connect = check_nargs_on_connect
         self._check_types_on_connect = check_types_on_connect
         self._slots: List[StoredSlot] = []
+        # immutable copy of `_slots` iterated by `_run_emit_loop`, rebuilt there
+        # (only) after connect/disconnect have reset it to None
+        self._slots_snapshot: Optional[Tuple[StoredSlot, ...]] = ()
         self._is_blocked: bool = False
         self._is_paused: bool = False
         self._lock = threading.RLock()
@@ -475,7 +469,7 @@ class SignalInstance:
                         extra = f"- Slot types {slot_sig} do not match types in signal."
                         self._raise_connection_error(slot, extra)
 
-                self._slots.append((_normalize_slot(slot), max_args))
+                self._append_slot((_normalize_slot(slot), max_args))
             return slot
 
         return _wrapper if slot is None else _wrapper(slot)
@@ -541,7 +535,7 @@ class SignalInstance:
                 setattr(ref(), attr, args[0] if len(args) == 1 else args)
 
             normed_callback = (ref, attr, _slot)
-            self._slots.append((normed_callback, maxargs))
+            self._append_slot((normed_callback, maxargs))
         return normed_callback
 
     def disconnect_setattr(
@@ -574,7 +568,7 @@ class SignalInstance:
                         idx = i
                         break
             if idx is not None:
-                self._slots.pop(idx)
+                self._remove_slot(idx)
             elif not missing_ok:
                 raise ValueError(f"No attribute setter connected for {obj}.{attr}")
 
@@ -645,7 +639,7 @@ class SignalInstance:
                     _obj.__setitem__(key, args[0] if len(args) == 1 else args)
 
             normed_callback = (ref, key, _slot)
-            self._slots.append((normed_callback, maxargs))
+            self._append_slot((normed_callback, maxargs))
         return cast("MethodRef", normed_callback)
 
     def disconnect_setitem(
@@ -678,7 +672,7 @@ class SignalInstance:
                         idx = i
                         break
             if idx is not None:
-                self._slots.pop(idx)
+                self._remove_slot(idx)
             elif not missing_ok:
                 raise ValueError(f"No item setter connected for {obj}.{key}")
 
@@ -709,6 +703,19 @@ class SignalInstance:
         _sig = None if isinstance(slot_sig, str) else slot_sig
         return _sig, maxargs
 
+    def _append_slot(self, slot: StoredSlot) -> None:
+        """Append a normalized `(callback, max_args)` slot to `self._slots`."""
+        self._slots.append(slot)
+        self._slots_snapshot = None
+
+    def _remove_slot(self, idx: Optional[int]) -> None:
+        """Remove slot at `idx` from `self._slots` (or all slots if `idx` is None)."""
+        if idx is None:
+            self._slots.clear()
+        else:
+            self._slots.pop(idx)
+        self._slots_snapshot = None
+
     def _raise_connection_error(self, slot: Callable, extra: str = "") -> NoReturn:
         name = getattr(slot, "__name__", str(slot))
         msg = f"Cannot connect slot {name!r} with signature: {signature(slot)}:\n"
@@ -744,12 +751,12 @@ class SignalInstance:
         with self._lock:
             if slot is None:
                 # NOTE: clearing an empty list is actually a RuntimeError in Qt
-                self._slots.clear()
+                self._remove_slot(None)
                 return
 
             idx = self._slot_index(slot)
             if idx != -1:
-                self._slots.pop(idx)
+                self._remove_slot(idx)
             elif not missing_ok:
                 raise ValueError(f"slot is not connected: {slot}")
 
@@ -887,10 +894,18 @@ class SignalInstance:
 
     def _run_emit_loop(self, args: Tuple[Any, ...]) -> None:
         rem: List[NormedCallback] = []
-        # allow receiver to query sender with Signal.current_emitter()
         with self._lock:
-            with Signal._emitting(self):
-                for (slot, max_args) in self._slots:
+            # iterate a snapshot, so that slots (dis)connected by a callback only
+            # take effect on the next emission
+            slots = self._slots_snapshot
+            if slots is None:
+                slots = self._slots_snapshot = tuple(self._slots)
+            # allow receiver to query sender with Signal.current_emitter()
+            # (swapped inline: a generator-based context manager costs more
+            # than the rest of the loop when only a slot or two is connected)
+            previous, Signal._current_emitter = Signal._current_emitter, self
+            try:
+                for (slot, max_args) in slots:
                     if isinstance(slot, tuple):
                         _ref, name, method = slot
                         obj = _ref()
@@ -914,6 +929,8 @@ class SignalInstance:
                         raise EmitLoopError(
                             slot=slot, args=args[:max_args], exc=e
                         ) from e
+            finally:
+                Signal._current_emitter = previous
 
             for slot in rem:
                 self.disconnect(slot)
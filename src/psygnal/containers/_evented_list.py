@@ -20,14 +20,22 @@ All of the additional list-like methods are provided by the MutableSequence
 interface, and call one of those 4 methods.  So if you override a method, you
 MUST make sure that all the appropriate events are emitted.  (Tests should
 cover this in test_evented_list.py)
+
+The one exception is `extend`, which is reimplemented for performance: it emits
+exactly the events that calling `insert` for each item would, and defers to
+`MutableSequence.extend` if a subclass overrides `insert`.
 """
 from __future__ import annotations  # pragma: no cover
 
+from bisect import bisect_right, insort
+from contextlib import contextmanager
 from typing import (
     Any,
     Iterable,
+    Iterator,
     List,
     MutableSequence,
+    Optional,
     Tuple,
     TypeVar,
     Union,
@@ -82,6 +90,166 @@ class ListEvents(SignalGroup):
     reordered = Signal()
     child_event = Signal(int, object, SignalInstance, tuple)
 
+    def __init__(self, instance: Any = None, name: Optional[str] = None) -> None:
+        super().__init__(instance, name)
+        self._batch_depth = 0
+        self._silenced = 0
+        self._signal_buffer: Optional[List[Tuple[SignalInstance, tuple]]] = None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Context manager that defers all list events until the context exits.
+
+        Events emitted by the list while in this context are buffered (in order)
+        and emitted when the outermost `batch` context exits.  Consecutive runs of
+        `inserting`/`inserted` (e.g. from `extend`) or `removing`/`removed` (e.g.
+        from `del lst[i:j]`) pairs covering a contiguous range are coalesced into a
+        single `changed(slice, old_values, new_values)` event, exactly as if the
+        range had been assigned with slice syntax.
+
+        Only events received solely through this group (i.e. `events.connect`) are
+        deferred.  A signal with receivers of its own (for example, anything
+        connected to `events.removed`), or that is paused, is still emitted as soon
+        as it happens (after emitting any events buffered before it, to preserve
+        their order), so that its receivers always see the list as it was when
+        the event occurred.
+
+        Examples
+        --------
+        >>> lst = EventedList()
+        >>> with lst.events.batch():
+        ...     lst.extend(range(100))  # a single `changed` event is emitted
+        """
+        if not self._batch_depth:
+            self._signal_buffer = []
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                buffer, self._signal_buffer = self._signal_buffer, None
+                self._flush(buffer or [])
+
+    @contextmanager
+    def suppress(self) -> Iterator[None]:
+        """Context manager that drops all list events emitted within the context.
+
+        Unlike `batch`, nothing is emitted when the context exits.
+        """
+        self._silenced += 1
+        try:
+            yield
+        finally:
+            self._silenced -= 1
+
+    def _emit(self, signal: SignalInstance, *args: Any) -> None:
+        """Emit `signal` with `args`, respecting `batch` and `suppress` contexts."""
+        if self._silenced:
+            return
+        if self._signal_buffer is not None:
+            if signal._is_blocked:
+                return
+            if signal._is_paused or len(signal) > (1 if self._slots else 0):
+                # not (only) received through the group relay: emit it now
+                buffer, self._signal_buffer = self._signal_buffer, []
+                self._flush(buffer)
+                signal.emit(*args)
+            else:
+                self._signal_buffer.append((signal, args))
+            return
+        # skip the cost of `emit` entirely if nothing would receive it
+        # (a paused signal must still queue `args` for when it is resumed)
+        if signal or signal._is_paused:
+            signal.emit(*args)
+
+    def _will_emit(self, signal: SignalInstance) -> bool:
+        """Return `True` if `_emit(signal, ...)` would emit or buffer anything."""
+        if self._silenced:
+            return False
+        if self._signal_buffer is not None:
+            return not signal._is_blocked
+        return bool(signal or signal._is_paused)
+
+    def _flush(self, buffer: List[Tuple[SignalInstance, tuple]]) -> None:
+        """Emit buffered events, coalescing contiguous insert/remove runs."""
+        i, n = 0, len(buffer)
+        while i < n:
+            j, start, old, new = self._coalesce(buffer, i)
+            if start is not None and j - i > 2:
+                self.changed.emit(slice(start, start + len(old)), old, new)
+            else:
+                j = i + 1
+                signal, args = buffer[i]
+                signal.emit(*args)
+            i = j
+
+    def _coalesce(
+        self, buffer: List[Tuple[SignalInstance, tuple]], i: int
+    ) -> Tuple[int, Optional[int], list, list]:
+        """Find the run of insert or remove pairs in `buffer` beginning at `i`.
+
+        Returns `(end, start, old, new)`, where `buffer[i:end]` is the run, and
+        `changed(slice(start, start + len(old)), old, new)` is its equivalent event
+        (`start` is None if there is no run).
+        """
+        pre, post = self.inserting, self.inserted
+        if buffer[i][0] is self.removing:
+            pre, post = self.removing, self.removed
+        start: Optional[int] = None
+        values: list = []
+        n = len(buffer)
+        while i + 1 < n:
+            (sig_a, args_a), (sig_b, args_b) = buffer[i], buffer[i + 1]
+            if sig_a is not pre or sig_b is not post or args_a[0] != args_b[0]:
+                break
+            idx = args_a[0]
+            if idx < 0:
+                # `insert` emits the index it was given, which may count from the
+                # end (i.e. not be where the item ends up): don't coalesce it.
+                break
+            if start is None:
+                start = idx
+            elif pre is self.inserting:
+                # inserts must be consecutive, each after the last (e.g. extend)
+                if idx != start + len(values):
+                    break
+            elif idx == start - 1:
+                # removals from the end of the range (e.g. del lst[i:j])
+                start = idx
+                values.insert(0, args_b[1])
+                i += 2
+                continue
+            elif idx != start:
+                # otherwise, removals must be repeated at the same index
+                break
+            values.append(args_b[1])
+            i += 2
+        if pre is self.inserting:
+            return i, start, [], values
+        return i, start, values, []
+
+
+class _BoundListSignal:
+    """Descriptor that binds `EventedList._ev_<name>` to `EventedList.events.<name>`.
+
+    As with `Signal.__get__`, the `SignalInstance` is looked up on first access and
+    then set on the list instance, so that this descriptor is never called again
+    (until the `events` group is replaced).  This avoids both creating signal
+    instances that are never used, and looking them up on the group each time.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = name
+        self._name = name[4:]  # strip "_ev_"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> SignalInstance:
+        if instance is None:
+            return self  # type: ignore
+        signal: SignalInstance = getattr(instance._events, self._name)
+        setattr(instance, self._attr, signal)
+        return signal
+
 
 class EventedList(MutableSequence[_T]):
     """Mutable Sequence that emits events when altered.
@@ -107,7 +275,15 @@ class EventedList(MutableSequence[_T]):
         SignalGroup that with events related to list mutation.  (see ListEvents)
     """
 
-    events: ListEvents  # pragma: no cover
+    _cls_name: str = "EventedList"  # set to `cls.__name__` in `__init_subclass__`
+
+    # signals emitted on (almost) every mutation, bound on first use.
+    _ev_inserting = _BoundListSignal()
+    _ev_inserted = _BoundListSignal()
+    _ev_removing = _BoundListSignal()
+    _ev_removed = _BoundListSignal()
+    _ev_changed = _BoundListSignal()
+    _ev_reordered = _BoundListSignal()
 
     def __init__(
         self,
@@ -120,23 +296,100 @@ class EventedList(MutableSequence[_T]):
         self._data: List[_T] = []
         self._hashable = hashable
         self._child_events = child_events
+        # skip `_pre_insert`, `_post_insert` and `_pre_remove` in mutations when they
+        # would do nothing (i.e. when not overridden, and child_events is False)
+        self._has_pre_insert = type(self)._pre_insert is not EventedList._pre_insert
+        self._has_post_insert = (
+            child_events or type(self)._post_insert is not EventedList._post_insert
+        )
+        self._has_pre_remove = (
+            child_events or type(self)._pre_remove is not EventedList._pre_remove
+        )
+        # `extend` can bypass `append` and `insert` unless either is overridden
+        cls = type(self)
+        self._fast_extend = (
+            cls.insert is EventedList.insert and cls.append is EventedList.append
+        )
+        # slices can be deleted without `_delitem_indices` unless it's overridden
+        self._fast_delitem = type(self)._delitem_indices is EventedList._delitem_indices
         self.events = ListEvents()
-        self.extend(data)
+        if (
+            self._fast_extend
+            and not (self._has_pre_insert or self._has_post_insert)
+            and type(self).extend is EventedList.extend
+        ):
+            # nothing can be connected to the events of a new list yet, so (as
+            # for slices returned by `__getitem__`) skip `extend` altogether,
+            # and leave its signals uninstantiated until they are first used.
+            self._data.extend(data)
+        else:
+            self.extend(data)
+
+    @classmethod
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._cls_name = cls.__name__
+
+    @property
+    def events(self) -> ListEvents:
+        """SignalGroup with events related to list mutation (see `ListEvents`)."""
+        return self._events
+
+    @events.setter
+    def events(self, events: ListEvents) -> None:
+        self._events = events
+        # unbind signals from any previous group (see `_BoundListSignal`)
+        for name in [k for k in self.__dict__ if k.startswith("_ev_")]:
+            del self.__dict__[name]
+
+    def __dir__(self) -> List[str]:
+        # hide the private aliases of `events` and its signals, so that they aren't
+        # found in addition to `events` (e.g. by `utils.iter_signal_instances`)
+        return [
+            n for n in super().__dir__() if n != "_events" and not n.startswith("_ev_")
+        ]
 
     # WAIT!! ... Read the module docstring before reimplement these methods
     # def append(self, item): ...
     # def clear(self): ...
     # def pop(self, index=-1): ...
-    # def extend(self, value: Iterable[_T]): ...
     # def remove(self, value: Any): ...
 
     def insert(self, index: int, value: _T) -> None:
         """Insert `value` before index."""
-        _value = self._pre_insert(value)
-        self.events.inserting.emit(index)
+        _value = self._pre_insert(value) if self._has_pre_insert else value
+        self._events._emit(self._ev_inserting, index)
         self._data.insert(index, _value)
-        self.events.inserted.emit(index, value)
-        self._post_insert(value)
+        self._events._emit(self._ev_inserted, index, value)
+        if self._has_post_insert:
+            self._post_insert(value)
+
+    def extend(self, values: Iterable[_T]) -> None:
+        """Extend list by appending elements from the iterable."""
+        if not self._fast_extend:
+            return super().extend(values)
+        if values is self:
+            values = list(values)
+
+        events = self._events
+        if not (
+            self._has_pre_insert
+            or self._has_post_insert
+            or events._will_emit(self._ev_inserting)
+            or events._will_emit(self._ev_inserted)
+        ):
+            self._data.extend(values)
+            return
+
+        # same as `self.insert(len(self), value)`, without the method calls
+        for value in values:
+            _value = self._pre_insert(value) if self._has_pre_insert else value
+            index = len(self._data)
+            events._emit(self._ev_inserting, index)
+            self._data.append(_value)
+            events._emit(self._ev_inserted, index, value)
+            if self._has_post_insert:
+                self._post_insert(value)
 
     @overload
     def __getitem__(self, key: int) -> _T:
@@ -161,28 +414,64 @@ class EventedList(MutableSequence[_T]):
 
     def __setitem__(self, key: Index, value: Union[_T, Iterable[_T]]) -> None:
         """Set self[key] to value."""
-        old = self._data[key]
-        if value is old:
-            return
-
+        old: Any
         if isinstance(key, slice):
             if not isinstance(value, Iterable):
                 raise TypeError("Can only assign an iterable to slice")
-            value = [self._pre_insert(v) for v in value]  # before we mutate the list
+            # collect values before we mutate the list
+            if self._has_pre_insert:
+                value = [self._pre_insert(v) for v in value]
+            else:
+                value = list(value)
+            if not self._events._will_emit(self._ev_changed):
+                # no need to copy the old values if nothing will receive them
+                self._data[key] = value
+                return
+            old = self._data[key]
         else:
-            value = self._pre_insert(cast("_T", value))
+            old = self._data[key]
+            if value is old:
+                return
+            if self._has_pre_insert:
+                value = self._pre_insert(cast("_T", value))
 
         self._data[key] = value  # type: ignore
-        self.events.changed.emit(key, old, value)
+        self._events._emit(self._ev_changed, key, old, value)
 
     def __delitem__(self, key: Index) -> None:
         """Delete self[key]."""
-        # delete from the end
+        if self._fast_delitem and isinstance(key, (int, slice)):
+            events = self._events
+            if not (
+                self._has_pre_remove
+                or events._will_emit(self._ev_removing)
+                or events._will_emit(self._ev_removed)
+            ):
+                del self._data[key]
+                return
+            indices: Iterable[int]
+            if isinstance(key, int):
+                indices = (key if key >= 0 else key + len(self),)
+            else:
+                # delete from the end: a range is already ordered, so needs no sort
+                indices = range(*key.indices(len(self)))
+                if indices.step > 0:
+                    indices = reversed(indices)
+            for index in indices:
+                events._emit(self._ev_removing, index)
+                if self._has_pre_remove:
+                    self._pre_remove(index)
+                item = self._data.pop(index)
+                events._emit(self._ev_removed, index, item)
+            return
+
+        # `_delitem_indices` is overridden, and may yield indices in any order
         for parent, index in sorted(self._delitem_indices(key), reverse=True):
-            parent.events.removing.emit(index)
-            parent._pre_remove(index)
+            parent._events._emit(parent._ev_removing, index)
+            if parent._has_pre_remove:
+                parent._pre_remove(index)
             item = parent._data.pop(index)
-            self.events.removed.emit(index, item)
+            self._events._emit(self._ev_removed, index, item)
 
     def _delitem_indices(self, key: Index) -> Iterable[Tuple[EventedList[_T], int]]:
         # returning (self, int) allows subclasses to pass nested members
@@ -196,7 +485,8 @@ class EventedList(MutableSequence[_T]):
 
     def _pre_insert(self, value: _T) -> _T:
         """Validate and or modify values prior to inserted."""
-        return value
+        # (never called unless overridden: see `_has_pre_insert`)
+        return value  # pragma: no cover
 
     def _post_insert(self, new_item: _T) -> None:
         """Modify and or handle values after insertion."""
@@ -237,10 +527,16 @@ class EventedList(MutableSequence[_T]):
 
     def __repr__(self) -> str:
         """Return repr(self)."""
-        return f"{type(self).__name__}({self._data})"
+        return f"{self._cls_name}({self._data})"
 
     def __eq__(self, other: Any) -> bool:
         """Return self==value."""
+        if other is self:
+            return True
+        if isinstance(other, EventedList):
+            # compare the underlying lists directly, rather than through
+            # list.__eq__ -> NotImplemented -> other.__eq__
+            return self._data == other._data
         return bool(self._data == other)
 
     def __hash__(self) -> int:
@@ -261,7 +557,7 @@ class EventedList(MutableSequence[_T]):
             super().reverse()
         else:
             self._data.reverse()
-        self.events.reordered.emit()
+        self._events._emit(self._ev_reordered)
 
     def move(self, src_index: int, dest_index: int = 0) -> bool:
         """Insert object at `src_index` before `dest_index`.
@@ -275,13 +571,13 @@ class EventedList(MutableSequence[_T]):
             # this is a no-op
             return False
 
-        self.events.moving.emit(src_index, dest_index)
+        self._events._emit(self._events.moving, src_index, dest_index)
         item = self._data.pop(src_index)
         if dest_index > src_index:
             dest_index -= 1
         self._data.insert(dest_index, item)
-        self.events.moved.emit(src_index, dest_index, item)
-        self.events.reordered.emit()
+        self._events._emit(self._events.moved, src_index, dest_index, item)
+        self._events._emit(self._ev_reordered)
         return True
 
     def move_multiple(self, sources: Iterable[Index], dest_index: int = 0) -> int:
@@ -324,11 +620,11 @@ class EventedList(MutableSequence[_T]):
         # `layoutChanged` while *manually* updating model indices with
         # `changePersistentIndexList`.  That becomes much harder to do with
         # nested tree-like models.
-        with self.events.reordered.blocked():
+        with self._ev_reordered.blocked():
             for src, dest in move_plan:
                 self.move(src, dest)
 
-        self.events.reordered.emit()
+        self._events._emit(self._ev_reordered)
         return len(move_plan)
 
     def _move_plan(
@@ -372,19 +668,19 @@ class EventedList(MutableSequence[_T]):
             dest_index += len(self) + 1
 
         d_inc = 0
-        popped: List[int] = []
+        popped: List[int] = []  # kept sorted, to count items before src by bisection
         for i, src in enumerate(to_move):
             if src != dest_index:
                 # we need to decrement the src_i by 1 for each time we have
                 # previously pulled items out from in front of the src_i
-                src -= sum(x <= src for x in popped)
+                src -= bisect_right(popped, src)
                 # if source is past the insertion point, increment src for each
                 # previous insertion
                 if src >= dest_index:
                     src += i
                 yield src, dest_index + d_inc
 
-            popped.append(src)
+            insort(popped, src)
             # if the item moved up, icrement the destination index
             if dest_index <= src:
                 d_inc += 1
@@ -417,4 +713,4 @@ class EventedList(MutableSequence[_T]):
         ):
             emitter, args = args[0]
 
-        self.events.child_event.emit(idx, obj, emitter, args)
+        self._events._emit(self._events.child_event, idx, obj, emitter, args)
@@ -1,5 +1,4 @@
-from functools import partial
-from typing import Any, Callable, Dict, Generic, List, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Type, TypeVar
 from weakref import finalize
 
 try:
@@ -38,6 +37,14 @@ class CallableProxyEvents(ProxyEvents):
 _OBJ_CACHE: Dict[int, ProxyEvents] = {}
 
 
+def _new_events(obj: Any, cls: Type[ProxyEvents]) -> ProxyEvents:
+    """Create and cache a new `cls` instance for `obj`, until `obj` is deleted."""
+    obj_id = id(obj)
+    events = _OBJ_CACHE[obj_id] = cls()
+    finalize(obj, _OBJ_CACHE.pop, obj_id, None)
+    return events
+
+
 class EventedObjectProxy(ObjectProxy, Generic[T]):
     """Create a proxy of `target` that includes an `events` [psygnal.SignalGroup][].
 
@@ -73,29 +80,37 @@ class EventedObjectProxy(ObjectProxy, Generic[T]):
     @property
     def events(self) -> ProxyEvents:  # pragma: no cover # unclear why
         """`SignalGroup` containing events for this object proxy."""
-        obj_id = id(self)
-        if obj_id not in _OBJ_CACHE:
-            _OBJ_CACHE[obj_id] = ProxyEvents()
-            finalize(self, partial(_OBJ_CACHE.pop, obj_id, None))
-        return _OBJ_CACHE[obj_id]
+        events = _OBJ_CACHE.get(id(self))
+        if events is None:
+            events = _new_events(self, ProxyEvents)
+        return events
 
     def __setattr__(self, name: str, value: None) -> None:
+        attribute_set = self.events.attribute_set
+        if not (attribute_set or attribute_set._is_paused):
+            # nothing will receive the event, so skip the identity check
+            super().__setattr__(name, value)
+            return
         before = getattr(self, name, _UNSET)
         super().__setattr__(name, value)
         after = getattr(self, name, _UNSET)
         if before is not after:
-            self.events.attribute_set(name, after)
+            attribute_set.emit(name, after)
 
     def __delattr__(self, name: str) -> None:
         super().__delattr__(name)
         self.events.attribute_deleted(name)
 
     def __setitem__(self, key: Any, value: Any) -> None:
+        item_set = self.events.item_set
+        if not (item_set or item_set._is_paused):
+            super().__setitem__(key, value)
+            return
         before = self[key]
         super().__setitem__(key, value)
         after = self[key]
         if before is not after:
-            self.events.item_set(key, after)
+            item_set.emit(key, after)
 
     def __delitem__(self, key: Any) -> None:
         super().__delitem__(key)
@@ -107,58 +122,44 @@ class EventedObjectProxy(ObjectProxy, Generic[T]):
     def __dir__(self) -> List[str]:
         return dir(self.__wrapped__) + ["events"]
 
-    def __iadd__(self, other: Any) -> T:
-        self.events.in_place("add", other)
-        return super().__iadd__(other)  # type: ignore
-
-    def __isub__(self, other: Any) -> T:
-        self.events.in_place("sub", other)
-        return super().__isub__(other)  # type: ignore
-
-    def __imul__(self, other: Any) -> T:
-        self.events.in_place("mul", other)
-        return super().__imul__(other)  # type: ignore
-
     def __imatmul__(self, other: Any) -> T:
-        self.events.in_place("matmul", other)
+        in_place = self.events.in_place
+        if in_place or in_place._is_paused:
+            in_place.emit("matmul", other)
         self.__wrapped__ @= other  # not in wrapt  # type: ignore
         return self
 
-    def __itruediv__(self, other: Any) -> T:
-        self.events.in_place("truediv", other)
-        return super().__itruediv__(other)  # type: ignore
-
-    def __ifloordiv__(self, other: Any) -> T:
-        self.events.in_place("floordiv", other)
-        return super().__ifloordiv__(other)  # type: ignore
-
-    def __imod__(self, other: Any) -> T:
-        self.events.in_place("mod", other)
-        return super().__imod__(other)  # type: ignore
-
-    def __ipow__(self, other: Any) -> T:
-        self.events.in_place("pow", other)
-        return super().__ipow__(other)  # type: ignore
 
-    def __ilshift__(self, other: Any) -> T:
-        self.events.in_place("lshift", other)
-        return super().__ilshift__(other)  # type: ignore
+def _make_in_place_method(op: str) -> Callable[[EventedObjectProxy, Any], Any]:
+    """Return an `__i{op}__` method that emits `in_place` before calling wrapt's."""
+    dunder = f"__i{op}__"
 
-    def __irshift__(self, other: Any) -> T:
-        self.events.in_place("rshift", other)
-        return super().__irshift__(other)  # type: ignore
+    def _method(self: EventedObjectProxy, other: Any) -> Any:
+        in_place = self.events.in_place
+        if in_place or in_place._is_paused:
+            in_place.emit(op, other)
+        return getattr(super(EventedObjectProxy, self), dunder)(other)
 
-    def __iand__(self, other: Any) -> T:
-        self.events.in_place("and", other)
-        return super().__iand__(other)  # type: ignore
+    _method.__name__ = _method.__qualname__ = dunder
+    return _method
 
-    def __ixor__(self, other: Any) -> T:
-        self.events.in_place("xor", other)
-        return super().__ixor__(other)  # type: ignore
 
-    def __ior__(self, other: Any) -> T:
-        self.events.in_place("or", other)
-        return super().__ior__(other)  # type: ignore
+_IN_PLACE_OPS = (
+    "add",
+    "sub",
+    "mul",
+    "truediv",
+    "floordiv",
+    "mod",
+    "pow",
+    "lshift",
+    "rshift",
+    "and",
+    "xor",
+    "or",
+)
+for _op in _IN_PLACE_OPS:
+    setattr(EventedObjectProxy, f"__i{_op}__", _make_in_place_method(_op))
 
 
 class EventedCallableObjectProxy(EventedObjectProxy):
@@ -201,11 +202,10 @@ class EventedCallableObjectProxy(EventedObjectProxy):
     @property
     def events(self) -> CallableProxyEvents:  # pragma: no cover # unclear why
         """`SignalGroup` containing events for this object proxy."""
-        obj_id = id(self)
-        if obj_id not in _OBJ_CACHE:
-            _OBJ_CACHE[obj_id] = CallableProxyEvents()
-            finalize(self, partial(_OBJ_CACHE.pop, obj_id, None))
-        return _OBJ_CACHE[obj_id]  # type: ignore
+        events = _OBJ_CACHE.get(id(self))
+        if events is None:
+            events = _new_events(self, CallableProxyEvents)
+        return events  # type: ignore
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Call the wrapped object and emit a `called` signal."""
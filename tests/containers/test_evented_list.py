@@ -7,6 +7,7 @@ import pytest
 
 from psygnal import EmissionInfo, Signal, SignalGroup
 from psygnal.containers import EventedList
+from psygnal.containers._evented_list import ListEvents
 
 
 @pytest.fixture
@@ -104,6 +105,11 @@ def test_hash(test_list):
 def test_repr(test_list):
     assert repr(test_list) == "EventedList([0, 1, 2, 3, 4])"
 
+    class MyList(EventedList):
+        pass
+
+    assert repr(MyList([1])) == "MyList([1])"
+
 
 def test_reverse(test_list):
     assert test_list == [0, 1, 2, 3, 4]
@@ -329,6 +335,16 @@ def test_child_events():
     del root[0]
     assert len(e_obj.test) == 0
 
+    # extend also connects child events
+    e_obj2 = E()
+    root.extend([e_obj, e_obj2])
+    assert len(e_obj.test) == len(e_obj2.test) == 1
+    mock.reset_mock()
+    e_obj2.test.emit("hi")
+    mock.assert_called_once_with(
+        EmissionInfo(root.events.child_event, (1, e_obj2, e_obj2.test, ("hi",)))
+    )
+
 
 def test_child_events_groups():
     """Test that evented lists bubble child events."""
@@ -367,3 +383,318 @@ def test_child_events_groups():
     # attribute on signal instances.
     assert e_obj.events.test2.instance.instance == e_obj
     mock.assert_has_calls(expected)
+
+
+def test_batch():
+    """Test that events emitted within `events.batch()` are coalesced."""
+    el = EventedList(range(5))
+    mock = Mock()
+    el.events.connect(mock)
+
+    with el.events.batch():
+        el.extend([5, 6, 7])
+        mock.assert_not_called()
+    mock.assert_called_once_with(
+        EmissionInfo(el.events.changed, (slice(5, 5), [], [5, 6, 7]))
+    )
+
+    mock.reset_mock()
+    with el.events.batch():
+        del el[1:4]
+        with el.events.batch():  # nested contexts flush on the outermost exit
+            el.append(8)
+    assert el == [0, 4, 5, 6, 7, 8]
+    assert mock.call_args_list == [
+        call(EmissionInfo(el.events.changed, (slice(1, 4), [1, 2, 3], []))),
+        call(EmissionInfo(el.events.inserting, (5,))),
+        call(EmissionInfo(el.events.inserted, (5, 8))),
+    ]
+
+    mock.reset_mock()
+    with el.events.batch():
+        del el[0]
+        del el[0]
+        el.reverse()
+    assert el == [8, 7, 6, 5]
+    assert mock.call_args_list == [
+        call(EmissionInfo(el.events.changed, (slice(0, 2), [0, 4], []))),
+        call(EmissionInfo(el.events.reordered, ())),
+    ]
+
+    # runs are not coalesced if a per-item signal is also connected directly
+    mock.reset_mock()
+    removed = Mock()
+    el.events.removed.connect(removed)
+    with el.events.batch():
+        del el[:2]
+        el.extend([1, 2])
+    assert el == [6, 5, 1, 2]
+    assert removed.call_args_list == [call(1, 7), call(0, 8)]
+    assert mock.call_args_list == [
+        call(EmissionInfo(el.events.removing, (1,))),
+        call(EmissionInfo(el.events.removed, (1, 7))),
+        call(EmissionInfo(el.events.removing, (0,))),
+        call(EmissionInfo(el.events.removed, (0, 8))),
+        call(EmissionInfo(el.events.changed, (slice(2, 2), [], [1, 2]))),
+    ]
+
+
+def test_batch_non_contiguous():
+    """Test that only contiguous runs are coalesced, and blocked events dropped."""
+    el = EventedList(range(5))
+    mock = Mock()
+    el.events.connect(mock)
+    with el.events.batch():
+        el.insert(0, "a")
+        el.insert(2, "b")
+        del el[0]
+        del el[2]
+    assert el == [0, "b", 2, 3, 4]
+    assert [c.args[0].signal.name for c in mock.call_args_list] == [
+        "inserting",
+        "inserted",
+        "inserting",
+        "inserted",
+        "removing",
+        "removed",
+        "removing",
+        "removed",
+    ]
+
+    mock.reset_mock()
+    el.events.inserted.block()
+    with el.events.batch():
+        el.append(5)
+    mock.assert_called_once_with(EmissionInfo(el.events.inserting, (5,)))
+
+
+def test_batch_negative_and_past_end_inserts():
+    """Test that events flushed from `batch()` can be replayed on the old list."""
+
+    def _replay(target: list, info: EmissionInfo) -> None:
+        if info.signal.name == "inserted":
+            target.insert(*info.args)
+        elif info.signal.name == "changed":
+            key, _, new = info.args
+            target[key] = new
+
+    el = EventedList([1, 2, 3])
+    replayed = list(el)
+    el.events.connect(lambda info: _replay(replayed, info))
+    with el.events.batch():
+        el.insert(-2, "a")
+        el.insert(-1, "b")
+        el.insert(10, "c")
+        el.insert(11, "d")
+    assert el == [1, "a", 2, "b", 3, "c", "d"]
+    assert replayed == el
+
+
+def test_suppress():
+    """Test that events emitted within `events.suppress()` are dropped."""
+    el = EventedList(range(5))
+    mock = Mock()
+    el.events.connect(mock)
+    with el.events.suppress():
+        el.extend([5, 6, 7])
+        del el[:2]
+        el[0] = 10
+    assert el == [10, 3, 4, 5, 6, 7]
+    mock.assert_not_called()
+    el.append(8)
+    assert mock.call_count == 2
+
+
+def test_unobserved_paused_signal():
+    """Test that events on a paused signal are queued, even with no slots."""
+    el = EventedList(range(5))
+    el.events.changed.pause()
+    el[0] = 10
+    mock = Mock()
+    el.events.changed.connect(mock)
+    el.events.changed.resume()
+    mock.assert_called_once_with(0, 0, 10)
+
+
+def test_pre_insert_override():
+    """Test that subclasses overriding `_pre_insert` may validate set values."""
+
+    class IntList(EventedList):
+        def _pre_insert(self, value):
+            if not isinstance(value, int):
+                raise TypeError("only ints allowed")
+            return value
+
+    el = IntList(range(5))
+    with pytest.raises(TypeError):
+        el[1:3] = [1, "2"]
+    assert el == [0, 1, 2, 3, 4]
+    el[1:3] = (i for i in (7, 8, 9))
+    assert el == [0, 7, 8, 9, 3, 4]
+    with pytest.raises(TypeError):
+        el[0] = "1"
+    el[0] = 10
+    assert el == [10, 7, 8, 9, 3, 4]
+
+
+@pytest.mark.parametrize("observed", [True, False])
+@pytest.mark.parametrize(
+    "key",
+    [slice(None), slice(2, 7), slice(1, None, 3), slice(None, None, -2), slice(-2, 1)],
+)
+def test_delete_slice(key, observed):
+    """Test that deleting slices matches list, removing from the end."""
+    regular = list(range(10))
+    el = EventedList(regular)
+    mock = Mock()
+    if observed:
+        el.events.removed.connect(mock)
+
+    del el[key]
+    del regular[key]
+    assert el == regular
+    if observed:
+        removed = list(range(10))[key]
+        expected = sorted(zip(range(10)[key], removed), reverse=True)
+        assert mock.call_args_list == [call(*args) for args in expected]
+
+
+def test_replace_events():
+    """Test that signals are bound lazily, and rebound when events are replaced."""
+    # the descriptor itself is returned on class access
+    assert EventedList._ev_changed is vars(EventedList)["_ev_changed"]
+    el = EventedList([0])
+    assert "_ev_changed" not in vars(el)
+    el[0] = 1
+    old_events = el.events
+    assert el._ev_changed is old_events.changed
+
+    el.events = ListEvents()
+    mock = Mock()
+    el.events.changed.connect(mock)
+    old_events.changed.connect(mock)
+    el[0] = 2
+    mock.assert_called_once_with(0, 1, 2)
+
+
+def test_delete_int_and_custom_indices():
+    """Test int deletion, and that overridden `_delitem_indices` are sorted."""
+    el = EventedList(range(5))
+    mock = Mock()
+    el.events.removing.connect(mock)
+    del el[-2]
+    mock.assert_called_once_with(3)
+    assert el == [0, 1, 2, 4]
+
+    class EvensList(EventedList):
+        """Deletes all even indices in addition to `key`."""
+
+        def _delitem_indices(self, key):
+            yield from super()._delitem_indices(key)
+            yield from ((self, i) for i in range(0, len(self), 2))
+
+        def _pre_remove(self, index):
+            pre_removed.append(index)
+
+    pre_removed: List[int] = []
+    el = EvensList(range(6))
+    el.events.removing.connect(mock)
+    mock.reset_mock()
+    del el[1]
+    assert mock.call_args_list == [call(4), call(2), call(1), call(0)]
+    assert pre_removed == [4, 2, 1, 0]
+    assert el == [3, 5]
+
+    mock.reset_mock()
+    del el[1:]
+    assert mock.call_args_list == [call(1), call(0)]
+    assert el == []
+
+
+def test_unobserved_extended_slice():
+    """Test extended slice assignment when `changed` has no receivers."""
+    el = EventedList(range(6))
+    el[::2] = (i * 10 for i in range(3))
+    assert el == [0, 1, 10, 3, 20, 5]
+    with pytest.raises(ValueError):
+        el[::2] = [1, 2]
+    assert el == [0, 1, 10, 3, 20, 5]
+
+
+def test_extend():
+    """Test that extend emits the same events as inserting each item."""
+    el = EventedList([0])
+    mock = Mock()
+    el.events.connect(mock)
+    el.extend(iter([1, 2]))
+    assert el == [0, 1, 2]
+    assert mock.call_args_list == [
+        call(EmissionInfo(el.events.inserting, (1,))),
+        call(EmissionInfo(el.events.inserted, (1, 1))),
+        call(EmissionInfo(el.events.inserting, (2,))),
+        call(EmissionInfo(el.events.inserted, (2, 2))),
+    ]
+
+    el.extend(el)
+    assert el == [0, 1, 2, 0, 1, 2]
+
+    class InsertList(EventedList):
+        def insert(self, index, value):
+            super().insert(index, value * 10)
+
+    el2 = InsertList([1, 2])
+    el2.extend([3])
+    assert el2 == [10, 20, 30]
+
+    class AppendList(EventedList):
+        def append(self, value):
+            super().append(value * 10)
+
+    el3 = AppendList()
+    el3.extend([1, 2])
+    assert el3 == [10, 20]
+
+
+def test_init_and_slice():
+    """Test that construction (e.g. of slices) still honors overridden hooks."""
+    el = EventedList(range(5))
+    sub = el[1:4]
+    assert type(sub) is EventedList
+    assert sub == [1, 2, 3]
+    mock = Mock()
+    sub.events.inserted.connect(mock)
+    sub.append(4)
+    mock.assert_called_once_with(3, 4)
+    assert el == [0, 1, 2, 3, 4]
+
+    class ExtendList(EventedList):
+        def extend(self, values):
+            super().extend(v * 10 for v in values)
+
+    class PreInsertList(EventedList):
+        def _pre_insert(self, value):
+            return value * 10
+
+    assert ExtendList([1, 2]) == [10, 20]
+    assert PreInsertList([1, 2]) == [10, 20]
+    assert PreInsertList([1, 2])[:1] == [100]
+
+    class AppendList(EventedList):
+        def append(self, value):
+            super().append(value * 10)
+
+    al = AppendList([1, 2])
+    assert al == [10, 20]
+    assert al[:1] == [100]
+    assert al.copy() == [100, 200]
+    assert al + [3] == [100, 200, 30]
+
+
+def test_eq():
+    el = EventedList([0, 1, 2])
+    assert el == el
+    assert el == EventedList([0, 1, 2])
+    assert el != EventedList([0, 1])
+    assert el == [0, 1, 2]
+    assert el != (0, 1, 2)
+    assert [0, 1, 2] == el
@@ -161,3 +161,20 @@ def test_evented_callable_proxy():
     ef = EventedCallableObjectProxy(f)
     ef(1, 2, foo="bar")
     assert calls == [((1, 2), {"foo": "bar"})]
+
+
+def test_unobserved_proxy_mutation():
+    class T:
+        x = 0
+
+    t = EventedObjectProxy(T())
+    d = EventedObjectProxy({})
+    t.x = 1
+    d["a"] = 1
+    assert t.x == 1
+    assert d == {"a": 1}
+
+    mock = Mock()
+    t.events.attribute_set.connect(mock)
+    t.x = 2
+    mock.assert_called_once_with("x", 2)
@@ -120,6 +120,17 @@ def test_item_discarded_from_selection_on_removal_from_list(
     test_list.selection.discard.assert_called_once()
 
 
+def test_items_discarded_from_selection_on_batched_removal() -> None:
+    """Check that batched (and coalesced) removals also update the selection."""
+    test_list = SelectableEventedList(["a", "b", "c", "d"])
+    test_list.events.connect(Mock())  # so that the removals could be coalesced
+    test_list.selection = {"b", "c"}
+    with test_list.events.batch():
+        del test_list[1:3]
+    assert test_list == ["a", "d"]
+    assert not test_list.selection
+
+
 def test_remove_selected(test_list: SelectableEventedList) -> None:
     """Test items are removed from both the selection and the list."""
     test_list.selection.clear()
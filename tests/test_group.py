@@ -133,6 +133,14 @@ def test_group_blocked_exclude():
     mock1.assert_not_called()
     mock2.assert_called_once_with("hi")
 
+    # exclude may be given as any iterable, including signal instances
+    mock2.reset_mock()
+    with group.blocked(exclude=(s for s in (group.sig2, group.sig1))):
+        group.sig1.emit(1)
+        group.sig2.emit("hi")
+    assert mock1.call_count == 1
+    mock2.assert_called_once_with("hi")
+
 
 def test_group_disconnect_single_slot():
     """Test that we can disconnect single slots from groups."""
@@ -168,3 +176,34 @@ def test_group_disconnect_all_slots():
 
     mock1.assert_not_called()
     mock2.assert_not_called()
+
+
+def test_group_relay_connected_lazily():
+    """Test that group signals are only relayed while the group has slots."""
+    group = MyGroup()
+    assert len(group.sig1) == 0
+    assert not group.sig1
+
+    mock = Mock()
+    group.connect(mock)
+    assert len(group.sig1) == 1
+    group.sig1.emit(1)
+    mock.assert_called_once_with(EmissionInfo(group.sig1, (1,)))
+
+    group.disconnect(mock)
+    assert len(group.sig1) == 0
+    mock.reset_mock()
+    group.sig1.emit(1)
+    mock.assert_not_called()
+
+
+def test_group_relay_order():
+    """Test that group slots are called in the order the relay was connected."""
+    group = MyGroup()
+    order = []
+    group.sig1.connect(lambda: order.append("direct"))
+    group.connect(lambda: order.append("group"))
+    group.sig1.connect(lambda: order.append("direct2"))
+    group.sig1.emit(1)
+    # the relay is connected with the first group slot, after "direct"
+    assert order == ["direct", "group", "direct2"]
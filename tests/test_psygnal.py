@@ -258,6 +258,23 @@ def test_basic_signal_with_sender_receiver():
     assert ref() == receiver
     assert name == "assert_not_sender"
     assert isinstance(e.value.__cause__, AssertionError)
+    # restored even when a callback raises.
+    assert Signal.current_emitter() is None
+
+
+def test_nested_emit_restores_emitter():
+    emitter = Emitter()
+    seen = []
+
+    def outer():
+        emitter.one_int.emit(1)
+        seen.append(Signal.current_emitter())
+
+    emitter.one_int.connect(lambda: seen.append(Signal.current_emitter()))
+    emitter.no_arg.connect(outer)
+    emitter.no_arg.emit()
+    assert seen == [emitter.one_int, emitter.no_arg]
+    assert Signal.current_emitter() is None
 
 
 def test_basic_signal_with_sender_nonreceiver():
@@ -346,12 +363,12 @@ def test_group_weakref(slot):
     emitter = MyGroup()
     obj = MyObj()
 
-    # simply by nature of being in a group, sig1 will have a callback
-    assert len(emitter.sig1) == 1
-    # but the group itself doesn't have any
+    # until the group has a callback, sig1 has no callbacks
+    assert len(emitter.sig1) == 0
     assert len(emitter) == 0
 
     # connecting something to the group adds to the group connections
+    # and relays sig1 to the group
     emitter.connect(
         partial(obj.f_int_int, 1) if slot == "partial" else getattr(obj, slot)
     )
@@ -363,8 +380,8 @@ def test_group_weakref(slot):
     del obj
     gc.collect()
     emitter.sig1.emit(1)  # this should trigger deletion, so would emitter.emit()
-    assert len(emitter.sig1) == 1
     assert len(emitter) == 0  # it's been cleaned up
+    assert len(emitter.sig1) == 0  # along with the relay
 
 
 def test_norm_slot():
@@ -786,3 +803,39 @@ def test_emit_loop_exceptions():
         emitter.one_int.emit(2)
     mock1.assert_called_once_with(2)
     mock1.assert_called_once_with(2)
+
+
+def test_disconnect_during_emit():
+    """Disconnecting a slot while emitting must not skip the remaining slots."""
+    emitter = Emitter()
+    calls = []
+
+    def once():
+        calls.append("once")
+        emitter.no_arg.disconnect(once)
+
+    emitter.no_arg.connect(once)
+    emitter.no_arg.connect(lambda: calls.append("other"))
+    emitter.no_arg.emit()
+    assert calls == ["once", "other"]
+    emitter.no_arg.emit()
+    assert calls == ["once", "other", "other"]
+
+
+def test_connect_during_emit():
+    """A slot connected while emitting is first called on the next emission."""
+    emitter = Emitter()
+    calls = []
+
+    def late():
+        calls.append("late")
+
+    def first():
+        calls.append("first")
+        emitter.no_arg.connect(late)
+
+    emitter.no_arg.connect(first)
+    emitter.no_arg.emit()
+    assert calls == ["first"]
+    emitter.no_arg.emit()
+    assert calls == ["first", "first", "late"]
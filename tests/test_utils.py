@@ -1,7 +1,8 @@
 from unittest.mock import Mock, call
 
 from psygnal import Signal
-from psygnal.utils import monitor_events
+from psygnal.containers import EventedList
+from psygnal.utils import iter_signal_instances, monitor_events
 
 
 def test_event_debugger(capsys):
@@ -30,3 +31,15 @@ def test_event_debugger(capsys):
 
     captured = capsys.readouterr()
     assert captured.out == "sig.emit(1, 2)\nsig.emit(3, 4)\n"
+
+
+def test_monitor_evented_list_private_attrs():
+    """Test that private aliases of EventedList signals aren't monitored twice."""
+    el = EventedList([0])
+    el[0] = 1  # binds the private `_ev_changed` alias
+    assert list(iter_signal_instances(el, include_private_attrs=True)) == [el.events]
+
+    _logger = Mock()
+    with monitor_events(el, _logger, include_private_attrs=True):
+        el.append(2)
+    assert _logger.call_count == 2